@@ -356,12 +356,12 @@ class ArgFileParser:
         return args
 
     def _get_index(self, args):
+        normalized_args = ['--' + arg.lower().replace('-', '') for arg in args]
         for opt in self._options:
-            start = opt + '=' if opt.startswith('--') else opt
+            long_opt = opt.startswith('--')
+            start = opt + '=' if long_opt else opt
             for index, arg in enumerate(args):
-                normalized_arg = (
-                    '--' + arg.lower().replace('-', '') if opt.startswith('--') else arg
-                )
+                normalized_arg = normalized_args[index] if long_opt else arg
                 # Handles `--argumentfile foo` and `-A foo`
                 if normalized_arg == opt and index + 1 < len(args):
                     return args[index+1], slice(index, index+2)